@@ -3,19 +3,22 @@ from django.urls import include, path
 from rest_framework.renderers import (
     CoreJSONRenderer, DocumentationRenderer, SchemaJSRenderer
 )
-from rest_framework.schemas import SchemaGenerator, get_schema_view
+from rest_framework.schemas import get_schema_view
 from rest_framework.settings import api_settings
 
 
 def get_docs_view(
         title=None, description=None, schema_url=None, urlconf=None,
-        public=True, patterns=None, generator_class=SchemaGenerator,
+        public=True, patterns=None, generator_class=None,
         authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES,
         permission_classes=api_settings.DEFAULT_PERMISSION_CLASSES,
         renderer_classes=None):
 
     if renderer_classes is None:
         renderer_classes = [DocumentationRenderer, CoreJSONRenderer]
+    if generator_class is None:
+        from rest_framework.schemas.coreapi import SchemaGenerator
+        generator_class = SchemaGenerator
 
     return get_schema_view(
         title=title,
@@ -33,10 +36,13 @@ def get_docs_view(
 
 def get_schemajs_view(
         title=None, description=None, schema_url=None, urlconf=None,
-        public=True, patterns=None, generator_class=SchemaGenerator,
+        public=True, patterns=None, generator_class=None,
         authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES,
         permission_classes=api_settings.DEFAULT_PERMISSION_CLASSES):
     renderer_classes = [SchemaJSRenderer]
+    if generator_class is None:
+        from rest_framework.schemas.coreapi import SchemaGenerator
+        generator_class = SchemaGenerator
 
     return get_schema_view(
         title=title,
@@ -54,7 +60,7 @@ def get_schemajs_view(
 
 def include_docs_urls(
         title=None, description=None, schema_url=None, urlconf=None,
-        public=True, patterns=None, generator_class=SchemaGenerator,
+        public=True, patterns=None, generator_class=None,
         authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES,
         permission_classes=api_settings.DEFAULT_PERMISSION_CLASSES,
         renderer_classes=None):
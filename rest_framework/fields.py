@@ -78,11 +78,21 @@ def is_simple_callable(obj):
             'Built-in function signatures are not inspectable. '
             'Wrap the function call in a simple, pure Python function.')
 
-    if not (inspect.isfunction(obj) or inspect.ismethod(obj) or isinstance(obj, functools.partial)):
+    if inspect.isfunction(obj):
+        return _is_simple_function(obj, bound=False)
+
+    # Bound methods are created afresh on every attribute access, so cache
+    # against the underlying function rather than the method object itself.
+    if inspect.ismethod(obj) and inspect.isfunction(obj.__func__):
+        return _is_simple_function(obj.__func__, bound=True)
+
+    if not (inspect.ismethod(obj) or isinstance(obj, functools.partial)):
         return False
 
-    sig = inspect.signature(obj)
-    params = sig.parameters.values()
+    return _has_no_required_params(inspect.signature(obj).parameters.values())
+
+
+def _has_no_required_params(params):
     return all(
         param.kind == param.VAR_POSITIONAL or
         param.kind == param.VAR_KEYWORD or
@@ -91,6 +101,28 @@ def is_simple_callable(obj):
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_simple_function(func, bound):
+    """
+    Cached signature check for plain functions. When `bound` is set the first
+    positional parameter is dropped, as it is supplied by the bound method.
+    """
+    # Read argument counts straight off the code object where we can, which
+    # avoids building a full `Signature`. Wrapped functions or those with an
+    # explicit `__signature__` need the full `inspect.signature` treatment.
+    code = getattr(func, '__code__', None)
+    if code is not None and not hasattr(func, '__wrapped__') and not hasattr(func, '__signature__'):
+        n_positional = code.co_argcount - (1 if bound and code.co_argcount else 0)
+        n_defaults = len(func.__defaults__ or ())
+        n_kwonly_defaults = len(func.__kwdefaults__ or ())
+        return n_positional <= n_defaults and code.co_kwonlyargcount <= n_kwonly_defaults
+
+    params = list(inspect.signature(func).parameters.values())
+    if bound and params and params[0].kind in (params[0].POSITIONAL_ONLY, params[0].POSITIONAL_OR_KEYWORD):
+        params = params[1:]
+    return _has_no_required_params(params)
+
+
 def get_attribute(instance, attrs):
     """
     Similar to Python's built in `getattr(instance, attr)`,
@@ -13,6 +13,7 @@ For example, you might have a `urls.py` that looks something like this:
 
     urlpatterns = router.urls
 """
+import importlib
 import itertools
 from collections import namedtuple
 
@@ -22,8 +23,6 @@ from django.urls import NoReverseMatch, path, re_path
 from rest_framework import views
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
-from rest_framework.schemas import SchemaGenerator
-from rest_framework.schemas.views import SchemaView
 from rest_framework.settings import api_settings
 from rest_framework.urlpatterns import format_suffix_patterns
 
@@ -341,6 +340,19 @@ class APIRootView(views.APIView):
         return Response(ret)
 
 
+class _LazyClassAttribute:
+    """
+    A class attribute that is imported on first access, so that importing
+    the router doesn't load the schema generation modules.
+    """
+    def __init__(self, module_name, attr):
+        self.module_name = module_name
+        self.attr = attr
+
+    def __get__(self, instance, owner):
+        return getattr(importlib.import_module(self.module_name), self.attr)
+
+
 class DefaultRouter(SimpleRouter):
     """
     The default router extends the SimpleRouter, but also adds in a default
@@ -351,8 +363,8 @@ class DefaultRouter(SimpleRouter):
     root_view_name = 'api-root'
     default_schema_renderers = None
     APIRootView = APIRootView
-    APISchemaView = SchemaView
-    SchemaGenerator = SchemaGenerator
+    APISchemaView = _LazyClassAttribute('rest_framework.schemas.views', 'SchemaView')
+    SchemaGenerator = _LazyClassAttribute('rest_framework.schemas', 'SchemaGenerator')
 
     def __init__(self, *args, **kwargs):
         if 'root_renderers' in kwargs:
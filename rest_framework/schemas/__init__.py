@@ -20,12 +20,33 @@ basic use-cases:
 
 Other access should target the submodules directly
 """
+import importlib
+
 from rest_framework.settings import api_settings
 
-from . import coreapi, openapi
-from .coreapi import AutoSchema, ManualSchema, SchemaGenerator  # noqa
 from .inspectors import DefaultSchema  # noqa
 
+# The `coreapi` and `openapi` modules depend on `serializers`, so they are
+# imported lazily on first access, rather than whenever `APIView` is imported.
+_lazy_exports = {
+    'coreapi': ('.coreapi', None),
+    'openapi': ('.openapi', None),
+    'AutoSchema': ('.coreapi', 'AutoSchema'),
+    'ManualSchema': ('.coreapi', 'ManualSchema'),
+    'SchemaGenerator': ('.coreapi', 'SchemaGenerator'),
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_exports:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    module_name, attr = _lazy_exports[name]
+    value = importlib.import_module(module_name, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
 
 def get_schema_view(
         title=None, url=None, description=None, urlconf=None, renderer_classes=None,
@@ -36,6 +57,8 @@ def get_schema_view(
     """
     Return a schema view.
     """
+    from . import coreapi, openapi
+
     if generator_class is None:
         if coreapi.is_enabled():
             generator_class = coreapi.SchemaGenerator
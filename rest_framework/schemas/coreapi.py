@@ -1,3 +1,4 @@
+import time
 import warnings
 from collections import Counter
 from urllib import parse
@@ -6,12 +7,21 @@ from django.db import models
 from django.utils.encoding import force_str
 
 from rest_framework import RemovedInDRF317Warning, exceptions, serializers
-from rest_framework.compat import coreapi, coreschema, uritemplate
+from rest_framework.compat import coreapi, coreschema
 from rest_framework.settings import api_settings
 
 from .generators import BaseSchemaGenerator
 from .inspectors import ViewInspector
-from .utils import get_pk_description, is_list_view
+from .utils import get_path_variables, get_pk_description, is_list_view
+
+_FORM_OR_BODY = frozenset(('form', 'body'))
+
+# Core API supports the following request encodings over HTTP...
+_SUPPORTED_MEDIA_TYPES = frozenset((
+    'application/json',
+    'application/x-www-form-urlencoded',
+    'multipart/form-data',
+))
 
 
 def common_path(paths):
@@ -26,10 +36,13 @@ def common_path(paths):
     return '/' + '/'.join(common)
 
 
+_STANDARD_ACTIONS = frozenset((
+    'retrieve', 'list', 'create', 'update', 'partial_update', 'destroy'
+))
+
+
 def is_custom_action(action):
-    return action not in {
-        'retrieve', 'list', 'create', 'update', 'partial_update', 'destroy'
-    }
+    return action not in _STANDARD_ACTIONS
 
 
 def distribute_links(obj):
@@ -83,9 +96,10 @@ def insert_into(target, keys, value):
     LinkNode({'a': LinkNode({'b': LinkNode({'c': LinkNode(links=[123])}}})))
     """
     for key in keys[:-1]:
-        if key not in target:
-            target[key] = LinkNode()
-        target = target[key]
+        node = target.get(key)
+        if node is None:
+            node = target[key] = LinkNode()
+        target = node
 
     try:
         target.links.append((keys[-1], value))
@@ -124,6 +138,32 @@ class SchemaGenerator(BaseSchemaGenerator):
 
         super().__init__(title, url, description, patterns, urlconf)
         self.coerce_method_names = api_settings.SCHEMA_COERCE_METHOD_NAMES
+        self._link_cache = {}
+
+    def _clear_caches(self):
+        super()._clear_caches()
+        self._link_cache.clear()
+
+    def _get_link(self, path, method, view, callback):
+        """
+        Return the `coreapi.Link` for the given endpoint.
+
+        Without a request, links don't vary between calls, so they are cached
+        when `SCHEMA_CACHE_TIMEOUT` is set.
+        """
+        timeout = api_settings.SCHEMA_CACHE_TIMEOUT
+        if not timeout or view.request is not None:
+            return view.schema.get_link(path, method, base_url=self.url)
+
+        cache_key = (callback, method, path)
+        now = time.monotonic()
+        entry = self._link_cache.get(cache_key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        link = view.schema.get_link(path, method, base_url=self.url)
+        self._link_cache[cache_key] = (now + timeout, link)
+        return link
 
     def get_links(self, request=None):
         """
@@ -139,20 +179,34 @@ class SchemaGenerator(BaseSchemaGenerator):
             return None
         prefix = self.determine_path_prefix(paths)
 
-        for path, method, view in view_endpoints:
+        # `view_endpoints` is in the same order as `self.endpoints`.
+        callbacks = [callback for _, _, callback in self.endpoints]
+        for (path, method, view), callback in zip(view_endpoints, callbacks):
             if not self.has_view_permissions(path, method, view):
                 continue
-            link = view.schema.get_link(path, method, base_url=self.url)
+            link = self._get_link(path, method, view, callback)
             subpath = path[len(prefix):]
             keys = self.get_keys(subpath, method, view)
             insert_into(links, keys, link)
 
         return links
 
+    def _get_schema_cache_key(self, request, public):
+        cache_key = super()._get_schema_cache_key(request, public)
+        if cache_key is None or self.url or request is None:
+            return cache_key
+        # The document embeds the request URL when no `url` is set.
+        return cache_key + (request.build_absolute_uri(),)
+
     def get_schema(self, request=None, public=False):
         """
         Generate a `coreapi.Document` representing the API schema.
         """
+        cache_key = self._get_schema_cache_key(request, public)
+        schema = self._get_cached_schema(cache_key)
+        if schema is not None:
+            return schema
+
         self._initialise_endpoints()
 
         links = self.get_links(None if public else request)
@@ -164,10 +218,12 @@ class SchemaGenerator(BaseSchemaGenerator):
             url = request.build_absolute_uri()
 
         distribute_links(links)
-        return coreapi.Document(
+        schema = coreapi.Document(
             title=self.title, description=self.description,
             url=url, content=links
         )
+        self._set_cached_schema(cache_key, schema)
+        return schema
 
     # Method for generating the link layout....
     def get_keys(self, subpath, method, view):
@@ -380,7 +436,7 @@ class AutoSchema(ViewInspector):
         manual_fields = self.get_manual_fields(path, method)
         fields = self.update_fields(fields, manual_fields)
 
-        if fields and any([field.location in ('form', 'body') for field in fields]):
+        if fields and any(field.location in _FORM_OR_BODY for field in fields):
             encoding = self.get_encoding(path, method)
         else:
             encoding = None
@@ -407,7 +463,7 @@ class AutoSchema(ViewInspector):
         model = getattr(getattr(view, 'queryset', None), 'model', None)
         fields = []
 
-        for variable in uritemplate.variables(path):
+        for variable in get_path_variables(path):
             title = ''
             description = ''
             schema_cls = coreschema.String
@@ -477,21 +533,18 @@ class AutoSchema(ViewInspector):
         if not isinstance(serializer, serializers.Serializer):
             return []
 
-        fields = []
-        for field in serializer.fields.values():
-            if field.read_only or isinstance(field, serializers.HiddenField):
-                continue
-
-            required = field.required and method != 'PATCH'
-            field = coreapi.Field(
+        partial = method == 'PATCH'
+        hidden_field_cls = serializers.HiddenField
+        return [
+            coreapi.Field(
                 name=field.field_name,
                 location='form',
-                required=required,
+                required=field.required and not partial,
                 schema=field_to_schema(field)
             )
-            fields.append(field)
-
-        return fields
+            for field in serializer.fields.values()
+            if not (field.read_only or isinstance(field, hidden_field_cls))
+        ]
 
     def get_pagination_fields(self, path, method):
         view = self.view
@@ -566,16 +619,10 @@ class AutoSchema(ViewInspector):
         """
         view = self.view
 
-        # Core API supports the following request encodings over HTTP...
-        supported_media_types = {
-            'application/json',
-            'application/x-www-form-urlencoded',
-            'multipart/form-data',
-        }
         parser_classes = getattr(view, 'parser_classes', [])
         for parser_class in parser_classes:
             media_type = getattr(parser_class, 'media_type', None)
-            if media_type in supported_media_types:
+            if media_type in _SUPPORTED_MEDIA_TYPES:
                 return media_type
             # Raw binary uploads are supported with "application/octet-stream"
             if media_type == '*/*':
@@ -3,12 +3,16 @@ generators.py   # Top-down schema generation
 
 See schemas.__init__.py for package overview.
 """
+import functools
 import re
+import time
+import weakref
 from importlib import import_module
 
 from django.conf import settings
 from django.contrib.admindocs.views import simplify_regex
 from django.core.exceptions import PermissionDenied
+from django.core.signals import setting_changed
 from django.http import Http404
 from django.urls import URLPattern, URLResolver
 
@@ -33,27 +37,47 @@ def is_api_view(callback):
     return (cls is not None) and issubclass(cls, APIView)
 
 
+_METHOD_PRIORITY = {
+    'GET': 0,
+    'POST': 1,
+    'PUT': 2,
+    'PATCH': 3,
+    'DELETE': 4
+}
+
+
 def endpoint_ordering(endpoint):
     path, method, callback = endpoint
-    method_priority = {
-        'GET': 0,
-        'POST': 1,
-        'PUT': 2,
-        'PATCH': 3,
-        'DELETE': 4
-    }.get(method, 5)
+    method_priority = _METHOD_PRIORITY.get(method, 5)
     return (method_priority,)
 
 
+_FORMAT_SUFFIXES = ('.{format}', '.{format}/')
+
 _PATH_PARAMETER_COMPONENT_RE = re.compile(
     r'<(?:(?P<converter>[^>:]+):)?(?P<parameter>\w+)>'
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _path_from_regex(path_regex):
+    # ???: Would it be feasible to adjust this such that we generate the
+    # path, plus the kwargs, plus the type from the converter, such that we
+    # could feed that straight into the parameter schema object?
+
+    path = simplify_regex(path_regex)
+
+    # Strip Django 2.0 converters as they are incompatible with uritemplate format
+    return re.sub(_PATH_PARAMETER_COMPONENT_RE, r'{\g<parameter>}', path)
+
+
 class EndpointEnumerator:
     """
     A class to determine the available API endpoints that a project exposes.
     """
+    # Depth of the current `get_api_endpoints` recursion into included URL confs.
+    _nesting_depth = 0
+
     def __init__(self, patterns=None, urlconf=None):
         if patterns is None:
             if urlconf is None:
@@ -72,43 +96,50 @@ class EndpointEnumerator:
     def get_api_endpoints(self, patterns=None, prefix=''):
         """
         Return a list of all available API endpoints by inspecting the URL conf.
+
+        Included URL confs are inspected by recursive calls. Only the outermost
+        call sorts the endpoints, rather than every level of nesting.
         """
         if patterns is None:
             patterns = self.patterns
 
         api_endpoints = []
 
-        for pattern in patterns:
-            path_regex = prefix + str(pattern.pattern)
-            if isinstance(pattern, URLPattern):
-                path = self.get_path_from_regex(path_regex)
-                callback = pattern.callback
-                if self.should_include_endpoint(path, callback):
-                    for method in self.get_allowed_methods(callback):
-                        endpoint = (path, method, callback)
-                        api_endpoints.append(endpoint)
-
-            elif isinstance(pattern, URLResolver):
-                nested_endpoints = self.get_api_endpoints(
-                    patterns=pattern.url_patterns,
-                    prefix=path_regex
-                )
-                api_endpoints.extend(nested_endpoints)
-
-        return sorted(api_endpoints, key=endpoint_ordering)
+        self._nesting_depth += 1
+        try:
+            for pattern in patterns:
+                path_regex = prefix + str(pattern.pattern)
+                if isinstance(pattern, URLPattern):
+                    path = self.get_path_from_regex(path_regex)
+                    callback = pattern.callback
+                    if self.should_include_endpoint(path, callback):
+                        for method in self.get_allowed_methods(callback):
+                            endpoint = (path, method, callback)
+                            api_endpoints.append(endpoint)
+
+                elif isinstance(pattern, URLResolver):
+                    nested_endpoints = self.get_api_endpoints(
+                        patterns=pattern.url_patterns,
+                        prefix=path_regex
+                    )
+                    api_endpoints.extend(nested_endpoints)
+        finally:
+            self._nesting_depth -= 1
+
+        if self._nesting_depth:
+            return api_endpoints
+
+        # Equivalent to `sorted(api_endpoints, key=endpoint_ordering)`, with
+        # the method priorities computed up front in a single pass.
+        priorities = [_METHOD_PRIORITY.get(method, 5) for _, method, _ in api_endpoints]
+        order = sorted(range(len(api_endpoints)), key=priorities.__getitem__)
+        return [api_endpoints[index] for index in order]
 
     def get_path_from_regex(self, path_regex):
         """
         Given a URL conf regex, return a URI template string.
         """
-        # ???: Would it be feasible to adjust this such that we generate the
-        # path, plus the kwargs, plus the type from the converter, such that we
-        # could feed that straight into the parameter schema object?
-
-        path = simplify_regex(path_regex)
-
-        # Strip Django 2.0 converters as they are incompatible with uritemplate format
-        return re.sub(_PATH_PARAMETER_COMPONENT_RE, r'{\g<parameter>}', path)
+        return _path_from_regex(path_regex)
 
     def should_include_endpoint(self, path, callback):
         """
@@ -124,7 +155,7 @@ class EndpointEnumerator:
             if callback.initkwargs['schema'] is None:
                 return False
 
-        if path.endswith('.{format}') or path.endswith('.{format}/'):
+        if path.endswith(_FORMAT_SUFFIXES):
             return False  # Ignore .json style URLs.
 
         return True
@@ -164,6 +195,8 @@ class BaseSchemaGenerator:
         self.version = version
         self.url = url
         self.endpoints = None
+        self._schema_cache = {}
+        _generators.add(self)
 
     def _initialise_endpoints(self):
         if self.endpoints is None:
@@ -188,14 +221,17 @@ class BaseSchemaGenerator:
         """
         Given a callback, return an actual view instance.
         """
+        # A fresh instance is created for each method. View instantiation is
+        # cheaper than copying a cached instance, and re-running `__init__`
+        # ensures descriptor-backed initkwargs (eg. `schema`) are applied.
         view = callback.cls(**getattr(callback, 'initkwargs', {}))
         view.args = ()
         view.kwargs = {}
         view.format_kwarg = None
         view.request = None
-        view.action_map = getattr(callback, 'actions', None)
 
         actions = getattr(callback, 'actions', None)
+        view.action_map = actions
         if actions is not None:
             if method == 'OPTIONS':
                 view.action = 'metadata'
@@ -225,6 +261,49 @@ class BaseSchemaGenerator:
     def get_schema(self, request=None, public=False):
         raise NotImplementedError(".get_schema() must be implemented in subclasses.")
 
+    def _get_schema_cache_key(self, request, public):
+        """
+        Return the key under which a generated schema may be cached, or `None`
+        if caching is disabled by `SCHEMA_CACHE_TIMEOUT`.
+
+        Schemas vary on view permissions, so the key includes the requesting
+        user and their groups. Schemas generated without permission checks
+        (no request, or `public`) share a key distinct from anonymous users.
+        """
+        if not api_settings.SCHEMA_CACHE_TIMEOUT:
+            return None
+        if request is None or public:
+            return ('unfiltered',)
+
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return ('anonymous',)
+        groups = getattr(user, 'groups', None)
+        group_pks = frozenset(groups.values_list('pk', flat=True)) if groups is not None else frozenset()
+        return ('user', user.pk, group_pks)
+
+    def _clear_caches(self):
+        self._schema_cache = {}
+
+    def _get_cached_schema(self, cache_key):
+        if cache_key is None:
+            return None
+        entry = self._schema_cache.get(cache_key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _set_cached_schema(self, cache_key, schema):
+        if cache_key is None or schema is None:
+            return
+        now = time.monotonic()
+        # Drop expired entries, so that per-user keys don't accumulate.
+        self._schema_cache = {
+            key: entry for key, entry in self._schema_cache.items()
+            if entry[0] > now
+        }
+        self._schema_cache[cache_key] = (now + api_settings.SCHEMA_CACHE_TIMEOUT, schema)
+
     def has_view_permissions(self, path, method, view):
         """
         Return `True` if the incoming request has the correct view permissions.
@@ -237,3 +316,16 @@ class BaseSchemaGenerator:
         except (exceptions.APIException, Http404, PermissionDenied):
             return False
         return True
+
+
+# Generators with cached schemas, cleared when the REST framework settings change.
+_generators = weakref.WeakSet()
+
+
+def _clear_schema_caches(*args, **kwargs):
+    if kwargs['setting'] == 'REST_FRAMEWORK':
+        for generator in list(_generators):
+            generator._clear_caches()
+
+
+setting_changed.connect(_clear_schema_caches)
@@ -19,8 +19,9 @@ class ViewInspector:
     Provide subclass for per-view schema generation
     """
 
-    # Used in _get_description_section()
-    header_regex = re.compile('^[a-zA-Z][0-9A-Za-z_]*:')
+    # Used in _get_description_section(). The `header` and `lead` groups
+    # capture the section name and the rest of the line in a single match.
+    header_regex = re.compile('^(?P<header>[a-zA-Z][0-9A-Za-z_]*):(?P<lead>.*)')
 
     def __init__(self):
         self.instance_schemas = WeakKeyDictionary()
@@ -90,14 +91,26 @@ class ViewInspector:
     def _get_description_section(self, view, header, description):
         lines = description.splitlines()
         current_section = ''
-        sections = {'': ''}
+        # Collect each section's lines in a list, joining once at the end,
+        # rather than repeatedly concatenating strings.
+        section_lines = {'': ['']}
+        match_header = self.header_regex.match
+        groupindex = self.header_regex.groupindex
+        has_named_groups = 'header' in groupindex and 'lead' in groupindex
 
         for line in lines:
-            if self.header_regex.match(line):
-                current_section, separator, lead = line.partition(':')
-                sections[current_section] = lead.strip()
+            match = match_header(line)
+            if match:
+                if has_named_groups:
+                    current_section, lead = match.group('header', 'lead')
+                else:
+                    # Overridden `header_regex` without `header`/`lead` groups.
+                    current_section, separator, lead = line.partition(':')
+                section_lines[current_section] = [lead.strip()]
             else:
-                sections[current_section] += '\n' + line
+                section_lines[current_section].append(line)
+
+        sections = {key: '\n'.join(value) for key, value in section_lines.items()}
 
         # TODO: SCHEMA_COERCE_METHOD_NAMES appears here and in `SchemaGenerator.get_keys`
         coerce_method_names = api_settings.SCHEMA_COERCE_METHOD_NAMES
@@ -20,7 +20,7 @@ from rest_framework.settings import api_settings
 
 from .generators import BaseSchemaGenerator
 from .inspectors import ViewInspector
-from .utils import get_pk_description, is_list_view
+from .utils import get_path_variables, get_pk_description, is_list_view
 
 
 class SchemaGenerator(BaseSchemaGenerator):
@@ -67,6 +67,11 @@ class SchemaGenerator(BaseSchemaGenerator):
         """
         Generate a OpenAPI schema.
         """
+        cache_key = self._get_schema_cache_key(request, public)
+        schema = self._get_cached_schema(cache_key)
+        if schema is not None:
+            return schema
+
         self._initialise_endpoints()
         components_schemas = {}
 
@@ -110,6 +115,7 @@ class SchemaGenerator(BaseSchemaGenerator):
                 'schemas': components_schemas
             }
 
+        self._set_cached_schema(cache_key, schema)
         return schema
 
 # View Inspectors
@@ -277,7 +283,7 @@ class AutoSchema(ViewInspector):
         model = getattr(getattr(self.view, 'queryset', None), 'model', None)
         parameters = []
 
-        for variable in uritemplate.variables(path):
+        for variable in get_path_variables(path):
             description = ''
             if model is not None:  # TODO: test this.
                 # Attempt to infer a field description if possible.
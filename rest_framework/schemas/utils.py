@@ -3,9 +3,12 @@ utils.py        # Shared helper functions
 
 See schemas.__init__.py for package overview.
 """
+import functools
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework.compat import uritemplate
 from rest_framework.mixins import RetrieveModelMixin
 
 
@@ -39,3 +42,13 @@ def get_pk_description(model, model_field):
         value_type=value_type,
         name=model._meta.verbose_name,
     )
+
+
+@functools.lru_cache(maxsize=2048)
+def get_path_variables(path):
+    """
+    Return the templated variables in the given path, eg. ('pk',) for '/users/{pk}/'.
+
+    The same path is typically seen once per HTTP method, so results are cached.
+    """
+    return tuple(uritemplate.variables(path))
@@ -126,6 +126,7 @@ DEFAULTS = {
         'retrieve': 'read',
         'destroy': 'delete'
     },
+    'SCHEMA_CACHE_TIMEOUT': None,
 }
 
 
@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+import textwrap
+
 from django.conf import settings
 
 from tests import importable
@@ -22,3 +27,26 @@ def test_serializer_fields_initialization():
     assert 'decimalfield' in serializer.fields
     assert 'durationfield' in serializer.fields
     assert 'listfield' in serializer.fields
+
+
+def test_schema_generators_not_imported_by_views_or_routers():
+    # Run in a fresh interpreter, as the test process has already imported them.
+    code = textwrap.dedent("""
+        import sys
+
+        import django
+        from django.conf import settings
+
+        settings.configure(INSTALLED_APPS=[
+            'django.contrib.contenttypes', 'django.contrib.auth', 'rest_framework',
+        ])
+        django.setup()
+
+        import rest_framework.routers
+        import rest_framework.views
+
+        for name in ('rest_framework.schemas.coreapi', 'rest_framework.schemas.openapi'):
+            assert name not in sys.modules, name
+    """)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
@@ -1,3 +1,4 @@
+import re
 import unittest
 
 import pytest
@@ -461,6 +462,58 @@ class TestSchemaGenerator(TestCase):
         )
         assert schema == expected
 
+    def test_schema_cache(self):
+        generator = SchemaGenerator(title='Example API', patterns=self.patterns)
+        request = Request(APIRequestFactory().get('/'))
+
+        assert generator.get_schema(request=request) is not generator.get_schema(request=request)
+
+        with override_settings(REST_FRAMEWORK={
+            'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.AutoSchema',
+            'SCHEMA_CACHE_TIMEOUT': 60,
+        }):
+            schema = generator.get_schema(request=request)
+            assert generator.get_schema(request=request) is schema
+            # The CoreAPI document embeds the request URL, so it is part of the key.
+            other_request = Request(APIRequestFactory().get('/?page=2'))
+            other_schema = generator.get_schema(request=other_request)
+            assert other_schema is not schema
+            assert other_schema.url == 'http://testserver/?page=2'
+
+    def test_links_cached_without_request(self):
+        generator = SchemaGenerator(title='Example API', patterns=self.patterns)
+        generator._initialise_endpoints()
+        assert generator.get_links()['example'].links[0][1] is not generator.get_links()['example'].links[0][1]
+
+        cache_settings = {
+            'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.AutoSchema',
+            'SCHEMA_CACHE_TIMEOUT': 60,
+        }
+        with override_settings(REST_FRAMEWORK=cache_settings):
+            link = generator.get_links()['example'].links[0][1]
+            assert generator.get_links()['example'].links[0][1] is link
+
+        # Changing the REST framework settings clears the cache.
+        with override_settings(REST_FRAMEWORK=cache_settings):
+            assert generator.get_links()['example'].links[0][1] is not link
+
+    def test_links_cached_per_callback(self):
+        patterns = [
+            path('example/', views.ExampleListView.as_view()),
+            path('example/', views.ExampleListView.as_view(
+                schema=ManualSchema(fields=[], description='Other'),
+            )),
+        ]
+        generator = SchemaGenerator(title='Example API', patterns=patterns)
+        with override_settings(REST_FRAMEWORK={
+            'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.AutoSchema',
+            'SCHEMA_CACHE_TIMEOUT': 60,
+        }):
+            schema = generator.get_schema()
+        descriptions = {link.description for link in schema['example'].values()}
+        assert len(descriptions) == 2
+        assert 'Other' in descriptions
+
 
 @unittest.skipUnless(coreapi, 'coreapi is not installed')
 @override_settings(REST_FRAMEWORK={'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.AutoSchema'})
@@ -1086,6 +1139,34 @@ def test_docstring_is_not_stripped_by_get_description():
     assert descr == formatting.dedent(ExampleDocstringAPIView.__doc__[1:][:-1])
 
 
+@pytest.mark.parametrize('header_regex', [
+    '^[a-zA-Z][0-9A-Za-z_]*:',
+    r'^(get|post)(_\w+)?:',
+])
+def test_get_description_with_header_regex_without_groups(header_regex):
+    class ExampleSchema(AutoSchema):
+        pass
+
+    ExampleSchema.header_regex = re.compile(header_regex)
+
+    class ExampleDocstringAPIView(APIView):
+        """
+        get: Fetch an example.
+        post: Create an example.
+        """
+        schema = ExampleSchema()
+
+        def get(self, *args, **kwargs):
+            pass
+
+        def post(self, request, *args, **kwargs):
+            pass
+
+    view = ExampleDocstringAPIView()
+    assert view.schema.get_description('example', 'get') == 'Fetch an example.'
+    assert view.schema.get_description('example', 'post') == 'Create an example.'
+
+
 # Views for SchemaGenerationExclusionTests
 with override_settings(REST_FRAMEWORK={'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.AutoSchema'}):
     class ExcludedAPIView(APIView):
@@ -1484,3 +1565,29 @@ def test_coreapi_deprecation():
 
     with pytest.warns(RemovedInDRF317Warning):
         is_enabled()
+
+
+def test_nested_url_confs_are_enumerated_through_get_api_endpoints():
+    prefixes = []
+
+    class RecordingEndpointEnumerator(EndpointEnumerator):
+        def get_api_endpoints(self, patterns=None, prefix=''):
+            prefixes.append(prefix)
+            return super().get_api_endpoints(patterns, prefix)
+
+    patterns = [
+        path('api/', include([
+            path('example/', views.ExampleListView.as_view()),
+            path('nested/', include([
+                path('detail/', views.ExampleDetailView.as_view()),
+            ])),
+        ])),
+    ]
+    endpoints = RecordingEndpointEnumerator(patterns).get_api_endpoints()
+
+    assert prefixes == ['', 'api/', 'api/nested/']
+    assert [(path, method) for path, method, callback in endpoints] == [
+        ('/api/example/', 'GET'),
+        ('/api/nested/detail/', 'GET'),
+        ('/api/example/', 'POST'),
+    ]
@@ -1,14 +1,18 @@
 import uuid
 import warnings
+from unittest import mock
 
 import pytest
+from django.contrib.auth.models import Group, User
 from django.db import models
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import path
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import filters, generics, pagination, routers, serializers
+from rest_framework import (
+    filters, generics, pagination, permissions, routers, serializers
+)
 from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.compat import uritemplate
 from rest_framework.parsers import JSONParser, MultiPartParser
@@ -18,6 +22,7 @@ from rest_framework.renderers import (
 )
 from rest_framework.request import Request
 from rest_framework.schemas.openapi import AutoSchema, SchemaGenerator
+from rest_framework.views import APIView
 
 from ..models import BasicModel
 from . import views
@@ -1246,6 +1251,82 @@ class TestGenerator(TestCase):
 
         assert schema['paths'] == {}
 
+    def test_schema_cache(self):
+        patterns = [
+            path('example/', views.ExampleListView.as_view()),
+        ]
+        generator = SchemaGenerator(patterns=patterns)
+
+        request = create_request('/')
+        assert generator.get_schema(request=request) is not generator.get_schema(request=request)
+
+        with override_settings(REST_FRAMEWORK={'SCHEMA_CACHE_TIMEOUT': 60}):
+            schema = generator.get_schema(request=request)
+            assert generator.get_schema(request=request) is schema
+            assert generator.get_schema(request=request, public=True) is not schema
+            # The OpenAPI schema doesn't embed the request URL.
+            assert generator.get_schema(request=create_request('/?page=2')) is schema
+
+    @override_settings(REST_FRAMEWORK={'SCHEMA_CACHE_TIMEOUT': 60})
+    def test_schema_cache_varies_on_user_and_groups(self):
+        patterns = [
+            path('example/', views.ExampleListView.as_view()),
+        ]
+        generator = SchemaGenerator(patterns=patterns)
+        user = User.objects.create_user('user')
+        group = Group.objects.create(name='group')
+
+        def authenticated_request():
+            request = create_request('/')
+            request.user = User.objects.get(pk=user.pk)
+            return request
+
+        anonymous_schema = generator.get_schema(request=create_request('/'))
+        user_schema = generator.get_schema(request=authenticated_request())
+        assert user_schema is not anonymous_schema
+        assert generator.get_schema(request=authenticated_request()) is user_schema
+
+        user.groups.add(group)
+        group_schema = generator.get_schema(request=authenticated_request())
+        assert group_schema is not user_schema
+        assert generator.get_schema(request=authenticated_request()) is group_schema
+
+    @override_settings(REST_FRAMEWORK={'SCHEMA_CACHE_TIMEOUT': 60})
+    def test_schema_cache_separates_unfiltered_and_anonymous_schemas(self):
+        class SecretView(APIView):
+            permission_classes = [permissions.IsAuthenticated]
+
+            def get(self, request, *args, **kwargs):
+                pass
+
+        patterns = [
+            path('secret/', SecretView.as_view()),
+        ]
+
+        generator = SchemaGenerator(patterns=patterns)
+        assert '/secret/' in generator.get_schema()['paths']
+        assert generator.get_schema(request=create_request('/'))['paths'] == {}
+
+        generator = SchemaGenerator(patterns=patterns)
+        assert generator.get_schema(request=create_request('/'))['paths'] == {}
+        assert '/secret/' in generator.get_schema()['paths']
+        assert '/secret/' in generator.get_schema(request=create_request('/'), public=True)['paths']
+
+    @override_settings(REST_FRAMEWORK={'SCHEMA_CACHE_TIMEOUT': 60})
+    def test_schema_cache_expiry(self):
+        patterns = [
+            path('example/', views.ExampleListView.as_view()),
+        ]
+        generator = SchemaGenerator(patterns=patterns)
+        request = create_request('/')
+
+        with mock.patch('rest_framework.schemas.generators.time.monotonic', return_value=1000):
+            schema = generator.get_schema(request=request)
+        with mock.patch('rest_framework.schemas.generators.time.monotonic', return_value=1059):
+            assert generator.get_schema(request=request) is schema
+        with mock.patch('rest_framework.schemas.generators.time.monotonic', return_value=1060):
+            assert generator.get_schema(request=request) is not schema
+
     def test_schema_information(self):
         """Construction of the top level dictionary."""
         patterns = [
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import math
 import os
 import re
@@ -122,6 +123,26 @@ class TestIsSimpleCallable:
             'Built-in function signatures are not inspectable. Wrap the '
             'function call in a simple, pure Python function.')
 
+    def test_keyword_only_arguments(self):
+        def valid(*, param='value'):
+            pass
+
+        def invalid(*, param):
+            pass
+
+        assert is_simple_callable(valid)
+        assert not is_simple_callable(invalid)
+
+    def test_wrapped_function(self):
+        def invalid(param):
+            pass
+
+        @functools.wraps(invalid)
+        def wrapper(*args, **kwargs):
+            return invalid(*args, **kwargs)
+
+        assert not is_simple_callable(wrapper)
+
     def test_type_annotation(self):
         # The annotation will otherwise raise a syntax error in python < 3.5
         locals = {}